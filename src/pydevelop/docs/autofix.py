@@ -1,10 +1,17 @@
 """Auto-fix utilities for common pydevelop-docs issues."""
 
 import re
+import tomllib
 from pathlib import Path
 from typing import Any, Dict, List
 
-import tomlkit
+# Issue format produced by ProjectAnalyzer._find_duplicate_keys (cli.py),
+# which only runs when pyproject.toml fails to parse; keep the two in sync:
+# "Duplicate dependency 'dep-name' (lines 123, 456)"
+_DUPLICATE_ISSUE_RE = re.compile(
+    r"Duplicate dependency '([^']+)' \(lines (\d+), (\d+)\)"
+)
+_UNSPLIT_QUOTE_RE = re.compile(r'([^"\s])(")')
 
 
 class AutoFixer:
@@ -36,10 +43,7 @@ class AutoFixer:
     def _prepare_duplicate_fix(self, issue: str) -> Dict[str, Any]:
         """Prepare fix for duplicate dependency."""
         # Extract dependency name and line numbers from issue
-        # Format: "Duplicate dependency 'dep-name' (lines 123, 456)"
-        match = re.search(
-            r"Duplicate dependency '([^']+)' \(lines (\d+), (\d+)\)", issue
-        )
+        match = _DUPLICATE_ISSUE_RE.search(issue)
         if not match:
             return None
 
@@ -93,18 +97,18 @@ class AutoFixer:
 
             # Try to parse and identify issues
             try:
-                tomlkit.parse(content)
+                tomllib.loads(content)
                 return True  # Already valid
             except Exception as parse_error:
                 # Common fixes
                 fixed_content = content
 
                 # Fix common quote issues
-                fixed_content = re.sub(r'([^"\s])(")', r"\1\n\2", fixed_content)
+                fixed_content = _UNSPLIT_QUOTE_RE.sub(r"\1\n\2", fixed_content)
 
                 # Try parsing again
                 try:
-                    tomlkit.parse(fixed_content)
+                    tomllib.loads(fixed_content)
                     with open(pyproject_path, "w") as f:
                         f.write(fixed_content)
 
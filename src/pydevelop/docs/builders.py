@@ -1,12 +1,14 @@
 """Documentation builders for different project types."""
 
+import os
 import shutil
 import subprocess
+import tomllib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import click
-import tomlkit
 
 from .config import get_haive_config
 
@@ -18,6 +20,8 @@ class BaseDocumentationBuilder:
         self.project_path = project_path
         self.config = config
         self.docs_path = project_path / "docs"
+        # Output sink; MonorepoBuilder swaps in a buffer for concurrent builds
+        self.echo: Callable[[str], Any] = click.echo
 
     def clean(self):
         """Clean build artifacts."""
@@ -26,11 +30,11 @@ class BaseDocumentationBuilder:
 
         if build_path.exists():
             shutil.rmtree(build_path)
-            click.echo(f"✅ Cleaned {build_path}")
+            self.echo(f"✅ Cleaned {build_path}")
 
         if autoapi_path.exists():
             shutil.rmtree(autoapi_path)
-            click.echo(f"✅ Cleaned {autoapi_path}")
+            self.echo(f"✅ Cleaned {autoapi_path}")
 
     def build(self, builder: str = "html", clean: bool = False, parallel: bool = True):
         """Build documentation."""
@@ -51,12 +55,13 @@ class BaseDocumentationBuilder:
         ]
 
         if parallel:
-            cmd.extend(["-j", "auto"])  # Use all CPU cores
+            # Use all CPU cores unless HAIVE_DOCS_JOBS pins a worker count
+            cmd.extend(["-j", os.environ.get("HAIVE_DOCS_JOBS", "auto")])
 
         cmd.extend([str(self.docs_path / "source"), str(build_dir)])
 
         # Run build
-        click.echo(f"🔨 Building {self.config.get('name', 'documentation')}...")
+        self.echo(f"🔨 Building {self.config.get('name', 'documentation')}...")
 
         try:
             result = subprocess.run(
@@ -64,15 +69,15 @@ class BaseDocumentationBuilder:
             )
 
             if result.returncode == 0:
-                click.echo(f"✅ Build successful: {build_dir}")
+                self.echo(f"✅ Build successful: {build_dir}")
                 return True
             else:
-                click.echo(f"❌ Build failed with errors:")
-                click.echo(result.stderr)
+                self.echo(f"❌ Build failed with errors:")
+                self.echo(result.stderr)
                 return False
 
         except Exception as e:
-            click.echo(f"❌ Build error: {e}")
+            self.echo(f"❌ Build error: {e}")
             return False
 
 
@@ -81,7 +86,7 @@ class SinglePackageBuilder(BaseDocumentationBuilder):
 
     def prepare(self):
         """Prepare single package for building."""
-        click.echo(f"📦 Preparing single package: {self.config['name']}")
+        self.echo(f"📦 Preparing single package: {self.config['name']}")
 
         # Ensure conf.py uses our config
         conf_path = self.docs_path / "source" / "conf.py"
@@ -160,21 +165,38 @@ class MonorepoBuilder(BaseDocumentationBuilder):
         for package in self.packages:
             click.echo(f"   • {package.name}")
 
-    def build_all(self, clean: bool = False, parallel: bool = True):
-        """Build documentation for all packages."""
-        results = []
-
-        for package in self.packages:
-            click.echo(f"\n📚 Building {package.name}...")
-
-            # Create builder for each package
-            pkg_config = {"name": package.name}
-            builder = SinglePackageBuilder(package, pkg_config)
-
-            # Prepare and build
-            builder.prepare()
-            success = builder.build(clean=clean, parallel=parallel)
-            results.append((package.name, success))
+    def build_all(self, clean: bool = False, parallel: bool = True, jobs: int = 1):
+        """Build documentation for all packages.
+
+        With ``jobs`` > 1, that many package builds run at once. Each build
+        is its own sphinx-build process, so threads only wait on them. Each
+        package's output is buffered and printed as one block when its build
+        finishes, so concurrent logs never interleave.
+        """
+        if jobs > 1 and len(self.packages) > 1:
+            by_package: Dict[Path, bool] = {}
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                futures = {}
+                for package in self.packages:
+                    lines: List[str] = []
+                    future = executor.submit(
+                        self._build_package, package, clean, parallel, lines.append
+                    )
+                    futures[future] = (package, lines)
+                for future in as_completed(futures):
+                    package, lines = futures[future]
+                    by_package[package] = future.result()
+                    click.echo("\n".join(lines))
+            successes = [by_package[package] for package in self.packages]
+        else:
+            successes = [
+                self._build_package(package, clean, parallel)
+                for package in self.packages
+            ]
+        results = [
+            (package.name, success)
+            for package, success in zip(self.packages, successes, strict=True)
+        ]
 
         # Summary
         click.echo("\n📊 Build Summary:")
@@ -184,6 +206,25 @@ class MonorepoBuilder(BaseDocumentationBuilder):
 
         return all(success for _, success in results)
 
+    def _build_package(
+        self,
+        package: Path,
+        clean: bool,
+        parallel: bool,
+        echo: Callable[[str], Any] = click.echo,
+    ) -> bool:
+        """Prepare and build a single package's documentation."""
+        echo(f"\n📚 Building {package.name}...")
+
+        # Create builder for each package
+        pkg_config = {"name": package.name}
+        builder = SinglePackageBuilder(package, pkg_config)
+        builder.echo = echo
+
+        # Prepare and build
+        builder.prepare()
+        return builder.build(clean=clean, parallel=parallel)
+
     def build_aggregate(self):
         """Build aggregate documentation using sphinx-collections."""
         click.echo("🔗 Building aggregate documentation...")
@@ -243,8 +284,8 @@ class CustomConfigBuilder(BaseDocumentationBuilder):
             with open(config_file) as f:
                 custom_config = yaml.safe_load(f)
         elif config_file.suffix == ".toml":
-            with open(config_file) as f:
-                custom_config = tomlkit.load(f)
+            with open(config_file, "rb") as f:
+                custom_config = tomllib.load(f)
         else:
             custom_config = {}
 
@@ -4,11 +4,18 @@ This tool can initialize Sphinx documentation with the full PyAutoDoc configurat
 for any Python project, whether it's a single package or monorepo.
 """
 
+import functools
+import hashlib
 import json
+import os
 import shutil
 import subprocess
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from string import Template
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import click
 import tomlkit
@@ -18,7 +25,294 @@ from .autofix import AutoFixer
 from .builders import MonorepoBuilder, get_builder
 from .config import get_haive_config
 from .display import EnhancedDisplay
-from .interactive import interactive_cli as run_interactive
+
+_TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_template(name: str) -> Template:
+    """Read a generator template from the package once and reuse it."""
+    return Template((_TEMPLATE_DIR / name).read_text())
+
+
+_INDEX_TEMPLATE = """
+Welcome to {name} Documentation
+{underline}
+
+.. toctree::
+   :maxdepth: 2
+   :caption: Contents:
+
+   autoapi/index
+   guides/index
+   examples/index
+   changelog
+
+Indices and tables
+==================
+
+* :ref:`genindex`
+* :ref:`modindex`
+* :ref:`search`
+"""
+
+_MAKEFILE = b"""# Minimal makefile for Sphinx documentation
+
+# You can set these variables from the command line.
+SPHINXOPTS    = -W --keep-going
+SPHINXBUILD   = sphinx-build
+SOURCEDIR     = source
+BUILDDIR      = build
+
+# Put it first so that "make" without argument is like "make help".
+help:
+\t@$(SPHINXBUILD) -M help "$(SOURCEDIR)" "$(BUILDDIR)" $(SPHINXOPTS) $(O)
+
+.PHONY: help Makefile
+
+# Catch-all target: route all unknown targets to Sphinx using the new
+# "make mode" option.  $(O) is meant as a shortcut for $(SPHINXOPTS).
+%: Makefile
+\t@$(SPHINXBUILD) -M $@ "$(SOURCEDIR)" "$(BUILDDIR)" $(SPHINXOPTS) $(O)
+
+# Custom targets
+clean:
+\trm -rf $(BUILDDIR)/* $(SOURCEDIR)/autoapi
+
+livehtml:
+\tsphinx-autobuild -b html $(SPHINXOPTS) $(SOURCEDIR) $(BUILDDIR)/html
+
+linkcheck:
+\t$(SPHINXBUILD) -b linkcheck $(SOURCEDIR) $(BUILDDIR)/linkcheck
+"""
+
+_BUILD_SCRIPT = b"""#!/bin/bash
+# Build documentation
+
+set -e
+
+echo "Building documentation..."
+
+# Clean previous builds
+rm -rf docs/build/*
+
+# Build HTML documentation
+cd docs && make html
+
+echo "Documentation built successfully!"
+echo "Open docs/build/html/index.html to view."
+"""
+
+# Per-user cache of pyproject-derived analysis results, one file per project
+_ANALYSIS_CACHE_DIR = Path("pydevelop-docs") / "analysis"
+
+# Bump when the cached analysis fields change shape; older entries then miss
+_ANALYSIS_CACHE_VERSION = 1
+
+# Below this many packages, init configures them serially; thread start-up
+# costs more than it saves.
+_PARALLEL_PACKAGE_THRESHOLD = 4
+
+# Sphinx toolchain added to poetry dev dependencies by ``init``.
+_DOCS_DEPS = MappingProxyType(
+    {
+        # Core dependencies
+        "sphinx": "^8.2.3",
+        "sphinx-autoapi": "^3.6.0",
+        "sphinx-autodoc-typehints": "^3.1.0",
+        "sphinxcontrib-autodoc-pydantic": "^2.2.0",
+        "furo": "^2024.8.6",
+        "myst-parser": "^4.0.1",
+        # UI enhancements
+        "sphinx-copybutton": "^0.5.2",
+        "sphinx-togglebutton": "^0.3.2",
+        "sphinx-design": "^0.6.1",
+        "sphinx-tabs": "^3.4.5",
+        "sphinx-inline-tabs": "^2023.4.21",
+        # Diagramming
+        "sphinxcontrib-mermaid": "^1.0.0",
+        "sphinxcontrib-plantuml": "^0.30",
+        "sphinxcontrib-blockdiag": "^3.0.0",
+        "sphinxcontrib-seqdiag": "^3.0.0",
+        # Code features
+        "sphinx-codeautolink": "^0.17.0",
+        "sphinx-exec-code": "^0.16",
+        "sphinx-runpython": "^0.4.0",
+        # Utilities
+        "sphinx-sitemap": "^2.6.0",
+        "sphinx-remove-toctrees": "^1.0.0",
+        "sphinx-last-updated-by-git": "^0.3.8",
+        "sphinxext-opengraph": "^0.10.0",
+        "sphinx-reredirects": "^1.0.0",
+        "sphinx-favicon": "^1.0.1",
+        "sphinxemoji": "^0.3.1",
+        "sphinx-tippy": "^0.4.3",
+        # Special support
+        "enum-tools": "^0.13.0",
+        "sphinx-toolbox": "^3.8.1",
+        "seed-intersphinx-mapping": "^1.2.2",
+        # Development
+        "sphinx-autobuild": "^2024.10.3",
+    }
+)
+
+_DOCS_GROUP_HEADER = "[tool.poetry.group.docs.dependencies]"
+
+# Pre-rendered docs group, appended verbatim when pyproject.toml has none
+_DOCS_GROUP_BLOCK = "".join(
+    [f"{_DOCS_GROUP_HEADER}\n"]
+    + [f'{name} = "{version}"\n' for name, version in _DOCS_DEPS.items()]
+)
+
+# Extensions configured in the generated conf.py, as shown by list-extensions
+_EXTENSIONS = (
+    "sphinx.ext.autodoc",
+    "sphinx.ext.autosummary",
+    "sphinx.ext.napoleon",
+    "sphinx.ext.viewcode",
+    "sphinx.ext.intersphinx",
+    "sphinx.ext.todo",
+    "sphinx.ext.coverage",
+    "sphinx.ext.mathjax",
+    "sphinx.ext.ifconfig",
+    "sphinx.ext.githubpages",
+    "sphinx.ext.inheritance_diagram",
+    "sphinx.ext.graphviz",
+    "autoapi.extension",
+    "sphinx_autodoc_typehints",
+    "sphinx.ext.autosectionlabel",
+    "myst_parser",
+    "sphinx_copybutton",
+    "sphinx_togglebutton",
+    "sphinx_design",
+    "sphinx_tabs.tabs",
+    "sphinx_inline_tabs",
+    "sphinxcontrib.mermaid",
+    "sphinxcontrib.plantuml",
+    "sphinxcontrib.blockdiag",
+    "sphinxcontrib.seqdiag",
+    "sphinx_codeautolink",
+    "sphinx_exec_code",
+    "sphinx_runpython",
+    "sphinx_tippy",
+    "sphinx_favicon",
+    "sphinxemoji.sphinxemoji",
+    "sphinx_sitemap",
+    "sphinx_last_updated_by_git",
+    "sphinxext.opengraph",
+    "sphinx_reredirects",
+    "sphinx_treeview",
+    "enum_tools.autoenum",
+    "sphinx_toolbox",
+    "sphinx_toolbox.more_autodoc.overloads",
+    "sphinx_toolbox.more_autodoc.typehints",
+    "sphinx_toolbox.more_autodoc.sourcelink",
+    "sphinxcontrib.autodoc_pydantic",
+)
+
+
+def _list_dir(path: Path) -> Set[str]:
+    """Return the entry names in ``path``, or an empty set if unreadable."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+def _list_packages(packages_dir: Path) -> List[str]:
+    """Return the monorepo package directory names under ``packages_dir``."""
+    try:
+        with os.scandir(packages_dir) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if not entry.name.startswith(".") and entry.is_dir()
+            ]
+    except OSError:
+        return []
+
+
+def _analysis_cache_path(project_path: Path) -> Optional[Path]:
+    """Return the user-cache file for ``project_path``'s analysis, if any.
+
+    Kept out of the project tree so analysis never leaves files behind in
+    the user's checkout. Returns None when no cache directory can be found.
+    """
+    try:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    except RuntimeError:
+        return None
+    key = hashlib.sha256(str(project_path.resolve()).encode()).hexdigest()
+    return base / _ANALYSIS_CACHE_DIR / f"{key}.json"
+
+
+def _is_package(entry: os.DirEntry) -> bool:
+    """Check whether a directory entry contains an ``__init__.py``."""
+    # A single stat on the joined path; no Path objects or directory listing.
+    return os.path.exists(os.path.join(entry.path, "__init__.py"))
+
+
+class _RecordedDisplay:
+    """Collect display calls made on a worker thread for in-order replay."""
+
+    def __init__(self):
+        self.calls: List[Tuple[str, str]] = []
+
+    def debug(self, message: str) -> None:
+        self.calls.append(("debug", message))
+
+    def error(self, message: str) -> None:
+        self.calls.append(("error", message))
+
+    def success(self, message: str) -> None:
+        self.calls.append(("success", message))
+
+    def warning(self, message: str) -> None:
+        self.calls.append(("warning", message))
+
+
+def _configure_package(
+    project_path: Path, pkg_path: Path, pkg_name: str, details: Dict[str, Any]
+) -> Tuple[bool, List[str], List[Tuple[str, str]]]:
+    """Set up one monorepo package's docs.
+
+    Returns (created, applied fixes, recorded display calls). The package
+    gets its own AutoFixer and display recorder, so nothing shared is
+    touched and the caller can emit the output in package order.
+    """
+    display = _RecordedDisplay()
+    autofix = AutoFixer(project_path, display)
+    display.debug(f"Processing package: {pkg_name}")
+
+    # Ensure docs structure exists
+    created = not details["docs_exists"]
+    if created:
+        display.debug(f"Creating docs structure for {pkg_name}")
+        (pkg_path / "docs" / "source").mkdir(parents=True, exist_ok=True)
+
+    # Update to use shared config
+    if autofix.ensure_shared_config(pkg_path, pkg_name):
+        display.debug(f"Updated {pkg_name} to use shared config")
+
+    # Create changelog
+    if autofix.create_changelog(pkg_path, pkg_name):
+        display.debug(f"Created changelog for {pkg_name}")
+
+    # Update index.rst
+    if autofix.update_index_rst(pkg_path, pkg_name):
+        display.debug(f"Updated index.rst for {pkg_name}")
+
+    return created, autofix.get_applied_fixes(), display.calls
+
+
+def _remove_tree(path: Path) -> Optional[OSError]:
+    """Remove a directory tree, returning the error instead of raising it."""
+    try:
+        shutil.rmtree(path)
+    except OSError as e:
+        return e
+    return None
 
 
 class ProjectAnalyzer:
@@ -26,9 +320,15 @@ class ProjectAnalyzer:
 
     def __init__(self, path: Path):
         self.path = path
+        self.pyproject_path = path / "pyproject.toml"
+        self._pyproject: Optional[Dict[str, Any]] = None
+
+    def analyze(self, packages: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Analyze project and return detailed configuration and package status.
 
-    def analyze(self) -> Dict[str, Any]:
-        """Analyze project and return detailed configuration and package status."""
+        When ``packages`` is given, only those monorepo packages are listed
+        and analyzed instead of every directory under ``packages/``.
+        """
         info = {
             "type": "unknown",
             "name": self.path.name,
@@ -38,32 +338,44 @@ class ProjectAnalyzer:
             "has_docs": (self.path / "docs").exists(),
             "central_hub": self._analyze_central_hub(),
             "structure": None,
-            "python_files": [],
-            "dependencies": self._analyze_dependencies(),
+            "dependencies": None,
+            "package_dirs": [],
         }
 
         # Detect package manager
-        if (self.path / "pyproject.toml").exists():
-            info["package_manager"] = self._detect_pyproject_manager()
-            info["name"] = self._get_project_name()
-        elif (self.path / "setup.py").exists():
-            info["package_manager"] = "setuptools"
-        elif (self.path / "requirements.txt").exists():
-            info["package_manager"] = "pip"
+        if self.pyproject_path.exists():
+            info.update(self._analyze_pyproject())
+        else:
+            info["dependencies"] = self._analyze_dependencies()
+            if (self.path / "setup.py").exists():
+                info["package_manager"] = "setuptools"
+            elif (self.path / "requirements.txt").exists():
+                info["package_manager"] = "pip"
 
         # Detect project type and structure
         if (self.path / "packages").exists():
             info["type"] = "monorepo"
-            package_names = [
-                p.name
-                for p in (self.path / "packages").iterdir()
-                if p.is_dir() and not p.name.startswith(".")
-            ]
+            package_names = _list_packages(self.path / "packages")
+            if packages:
+                # Restrict to requested names, which must match a discovered
+                # package directory (no "..", "src" or nested paths)
+                discovered = set(package_names)
+                package_names = [
+                    name for name in dict.fromkeys(packages) if name in discovered
+                ]
             info["packages"] = package_names
-            info["package_details"] = {
-                name: self._analyze_package(self.path / "packages" / name)
-                for name in package_names
-            }
+            # Package checks are independent and I/O-bound, so overlap them
+            if package_names:
+                with ThreadPoolExecutor(
+                    max_workers=min(32, len(package_names))
+                ) as executor:
+                    details = executor.map(
+                        self._analyze_package,
+                        [self.path / "packages" / name for name in package_names],
+                    )
+                    info["package_details"] = dict(
+                        zip(package_names, details, strict=True)
+                    )
         else:
             info["type"] = "single"
             info["package_details"] = {"single": self._analyze_package(self.path)}
@@ -71,137 +383,196 @@ class ProjectAnalyzer:
         # Detect source structure
         if (self.path / "src").exists():
             info["structure"] = "src"
-            info["python_files"] = list((self.path / "src").rglob("*.py"))
-        elif list(self.path.glob("*.py")):
+        elif any(self.path.glob("*.py")):
             info["structure"] = "flat"
-            info["python_files"] = list(self.path.glob("**/*.py"))
+
+        # Top-level package directories, used for autoapi_dirs outside src/
+        if info["structure"] != "src":
+            with os.scandir(self.path) as entries:
+                info["package_dirs"] = [
+                    entry.name
+                    for entry in entries
+                    if entry.is_dir() and _is_package(entry)
+                ]
 
         return info
 
     def _analyze_package(self, package_path: Path) -> Dict[str, Any]:
         """Analyze individual package structure and status."""
+        # One directory listing per level instead of a stat per checked path
+        top = _list_dir(package_path)
+        docs = _list_dir(package_path / "docs") if "docs" in top else set()
+        source = (
+            _list_dir(package_path / "docs" / "source") if "source" in docs else set()
+        )
         return {
-            "src_exists": (package_path / "src").exists(),
-            "docs_exists": (package_path / "docs").exists(),
-            "docs_source_exists": (package_path / "docs" / "source").exists(),
-            "pyproject_exists": (package_path / "pyproject.toml").exists(),
-            "conf_py_exists": (package_path / "docs" / "source" / "conf.py").exists(),
-            "changelog_exists": (
-                package_path / "docs" / "source" / "changelog.rst"
-            ).exists(),
-            "index_rst_exists": (
-                package_path / "docs" / "source" / "index.rst"
-            ).exists(),
-            "uses_shared_config": self._uses_shared_config(package_path),
-            "python_files_count": (
-                len(list(package_path.rglob("*.py"))) if package_path.exists() else 0
+            "src_exists": "src" in top,
+            "docs_exists": "docs" in top,
+            "docs_source_exists": "source" in docs,
+            "pyproject_exists": "pyproject.toml" in top,
+            "conf_py_exists": "conf.py" in source,
+            "changelog_exists": "changelog.rst" in source,
+            "index_rst_exists": "index.rst" in source,
+            "uses_shared_config": (
+                "conf.py" in source and self._uses_shared_config(package_path)
             ),
         }
 
     def _analyze_central_hub(self) -> Dict[str, Any]:
         """Analyze central documentation hub status."""
         docs_path = self.path / "docs"
+        # Same listing-per-level approach as _analyze_package
+        docs = _list_dir(docs_path)
+        source = _list_dir(docs_path / "source") if "source" in docs else set()
         return {
             "exists": docs_path.exists(),
-            "source_exists": (docs_path / "source").exists(),
-            "conf_py_exists": (docs_path / "source" / "conf.py").exists(),
-            "index_rst_exists": (docs_path / "source" / "index.rst").exists(),
-            "collections_configured": self._check_collections_config(docs_path),
-            "build_exists": (docs_path / "build").exists(),
+            "source_exists": "source" in docs,
+            "conf_py_exists": "conf.py" in source,
+            "index_rst_exists": "index.rst" in source,
+            "collections_configured": (
+                "conf.py" in source and self._check_collections_config(docs_path)
+            ),
+            "build_exists": "build" in docs,
         }
 
     def _analyze_dependencies(self) -> Dict[str, Any]:
         """Analyze dependency status and conflicts."""
-        pyproject_path = self.path / "pyproject.toml"
+        pyproject_path = self.pyproject_path
         issues = []
 
         if not pyproject_path.exists():
             return {"valid": False, "issues": ["No pyproject.toml found"]}
 
         try:
-            with open(pyproject_path, "r") as f:
-                content = f.read()
-
-            # Check for duplicate entries
-            lines = content.split("\n")
-            seen_deps = {}
-            for i, line in enumerate(lines, 1):
-                if "=" in line and not line.strip().startswith("#"):
-                    dep_name = line.split("=")[0].strip()
-                    if dep_name in seen_deps and dep_name:
-                        issues.append(
-                            f"Duplicate dependency '{dep_name}' (lines {seen_deps[dep_name]}, {i})"
-                        )
-                    else:
-                        seen_deps[dep_name] = i
-
-            # Try to parse TOML
-            import tomlkit
-
-            tomlkit.parse(content)
+            content = pyproject_path.read_text()
+        except (OSError, UnicodeDecodeError) as e:
+            return {"valid": False, "issues": [f"TOML parse error: {str(e)}"]}
 
-        except Exception as e:
+        try:
+            # Validate with the fast read-only parser and keep the result,
+            # so _load_pyproject doesn't parse the file a second time
+            self._pyproject = tomllib.loads(content)
+        except tomllib.TOMLDecodeError as e:
+            # Only a broken file can hold duplicate keys; locate them for
+            # AutoFixer, which needs the line numbers
+            issues.extend(self._find_duplicate_keys(content))
             issues.append(f"TOML parse error: {str(e)}")
 
         return {"valid": len(issues) == 0, "issues": issues}
 
+    def _find_duplicate_keys(self, content: str) -> List[str]:
+        """Report keys defined twice within the same TOML table."""
+        issues = []
+        seen_deps = {}
+        for i, line in enumerate(content.split("\n"), 1):
+            stripped = line.strip()
+            if stripped.startswith("["):
+                # Keys only clash within a single table
+                seen_deps = {}
+            elif "=" in line and not stripped.startswith("#"):
+                dep_name = line.split("=")[0].strip()
+                if dep_name in seen_deps and dep_name:
+                    issues.append(
+                        f"Duplicate dependency '{dep_name}' (lines {seen_deps[dep_name]}, {i})"
+                    )
+                else:
+                    seen_deps[dep_name] = i
+        return issues
+
     def _uses_shared_config(self, package_path: Path) -> bool:
         """Check if package uses shared pydevelop_docs config."""
         conf_py = package_path / "docs" / "source" / "conf.py"
-        if not conf_py.exists():
-            return False
-
+        # Byte search: no decode pass, and a missing file is just an OSError
         try:
-            content = conf_py.read_text()
-            return "pydevelop_docs.config" in content
-        except:
+            return b"pydevelop_docs.config" in conf_py.read_bytes()
+        except OSError:
             return False
 
     def _check_collections_config(self, docs_path: Path) -> bool:
         """Check if sphinx-collections is configured."""
         conf_py = docs_path / "source" / "conf.py"
-        if not conf_py.exists():
-            return False
-
+        # Byte search: no decode pass, and a missing file is just an OSError
         try:
-            content = conf_py.read_text()
-            return "sphinxcontrib.collections" in content
-        except:
+            return b"sphinxcontrib.collections" in conf_py.read_bytes()
+        except OSError:
             return False
 
-    def _detect_pyproject_manager(self) -> str:
+    def _analyze_pyproject(self) -> Dict[str, Any]:
+        """Return the pyproject-derived fields, reusing the on-disk cache.
+
+        Only values computed from ``pyproject.toml`` itself are cached; the
+        filesystem checks in ``analyze()`` always run fresh. The cache is
+        keyed on the cache format version plus mtime and size, so upgrades
+        and copied-over files are caught too.
+        """
+        st = os.stat(self.pyproject_path)
+        key = [_ANALYSIS_CACHE_VERSION, st.st_mtime_ns, st.st_size]
+        cache_path = _analysis_cache_path(self.path)
+
+        if cache_path is not None:
+            try:
+                with open(cache_path, "r") as f:
+                    cached = json.load(f)
+                if cached.get("_key") == key:
+                    return cached["pyproject"]
+            except (OSError, ValueError, KeyError):
+                pass
+
+        dependencies = self._analyze_dependencies()
+        data = self._load_pyproject()
+        result = {
+            "package_manager": self._detect_pyproject_manager(data),
+            "name": self._get_project_name(data),
+            "dependencies": dependencies,
+        }
+
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(cache_path, "w") as f:
+                    json.dump({"_key": key, "pyproject": result}, f)
+            except OSError:
+                pass
+
+        return result
+
+    def _load_pyproject(self) -> Optional[Dict[str, Any]]:
+        """Parse pyproject.toml once and cache it for the other helpers."""
+        if self._pyproject is None:
+            try:
+                with open(self.pyproject_path, "rb") as f:
+                    self._pyproject = tomllib.load(f)
+            except (OSError, tomllib.TOMLDecodeError):
+                return None
+        return self._pyproject
+
+    def _detect_pyproject_manager(self, data: Optional[Dict[str, Any]]) -> str:
         """Detect which tool manages the pyproject.toml."""
-        try:
-            with open(self.path / "pyproject.toml") as f:
-                data = tomlkit.load(f)
-
-            if "poetry" in data.get("tool", {}):
-                return "poetry"
-            elif "hatch" in data.get("tool", {}):
-                return "hatch"
-            elif "pdm" in data.get("tool", {}):
-                return "pdm"
-            elif "setuptools" in data.get("tool", {}):
-                return "setuptools"
-            else:
-                return "pep621"  # Standard pyproject.toml
-        except:
+        if data is None:
             return "unknown"
 
-    def _get_project_name(self) -> str:
+        if "poetry" in data.get("tool", {}):
+            return "poetry"
+        elif "hatch" in data.get("tool", {}):
+            return "hatch"
+        elif "pdm" in data.get("tool", {}):
+            return "pdm"
+        elif "setuptools" in data.get("tool", {}):
+            return "setuptools"
+        else:
+            return "pep621"  # Standard pyproject.toml
+
+    def _get_project_name(self, data: Optional[Dict[str, Any]]) -> str:
         """Extract project name from pyproject.toml."""
-        try:
-            with open(self.path / "pyproject.toml") as f:
-                data = tomlkit.load(f)
-
-            # Try different locations
-            if "poetry" in data.get("tool", {}):
-                return data["tool"]["poetry"].get("name", self.path.name)
-            elif "project" in data:
-                return data["project"].get("name", self.path.name)
-            else:
-                return self.path.name
-        except:
+        if data is None:
+            return self.path.name
+
+        # Try different locations
+        if "poetry" in data.get("tool", {}):
+            return data["tool"]["poetry"].get("name", self.path.name)
+        elif "project" in data:
+            return data["project"].get("name", self.path.name)
+        else:
             return self.path.name
 
 
@@ -211,13 +582,13 @@ class DocsInitializer:
     def __init__(self, project_path: Path, project_info: Dict[str, Any]):
         self.project_path = project_path
         self.project_info = project_info
-        self.template_path = Path(__file__).parent / "templates"
+        self.template_path = _TEMPLATE_DIR
+        self.docs_path = project_path / "docs"
+        self.source_path = self.docs_path / "source"
 
     def initialize(self, force: bool = False):
         """Initialize documentation structure."""
-        docs_path = self.project_path / "docs"
-
-        if docs_path.exists() and not force:
+        if self.docs_path.exists() and not force:
             raise click.ClickException(
                 "Documentation already exists! Use --force to overwrite."
             )
@@ -225,14 +596,18 @@ class DocsInitializer:
         # Create directory structure
         self._create_directories()
 
-        # Copy static files and templates
-        self._copy_static_files()
-
-        # Generate configuration files
-        self._generate_conf_py()
-        self._generate_index_rst()
-        self._generate_makefile()
-        self._generate_build_scripts()
+        # Copy static files and generate configuration files. Each step
+        # writes to its own paths, so they can overlap.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self._copy_static_files),
+                executor.submit(self._generate_conf_py),
+                executor.submit(self._generate_index_rst),
+                executor.submit(self._generate_makefile),
+                executor.submit(self._generate_build_scripts),
+            ]
+            for future in futures:
+                future.result()
 
         # Add dependencies if using Poetry
         if self.project_info["package_manager"] == "poetry":
@@ -240,13 +615,11 @@ class DocsInitializer:
 
     def _create_directories(self):
         """Create standard documentation directory structure."""
+        # Leaf directories only; parents=True creates docs/, docs/source/,
+        # _static/ and _templates/ along the way.
         dirs = [
-            "docs",
-            "docs/source",
-            "docs/source/_static",
             "docs/source/_static/css",
             "docs/source/_static/js",
-            "docs/source/_templates",
             "docs/source/_templates/includes",
             "docs/source/api",
             "docs/source/guides",
@@ -272,8 +645,10 @@ class DocsInitializer:
             src_path = self.template_path / src
             dest_path = self.project_path / dest
 
+            # copyfile skips copy2's metadata syscalls. Only a missing bundled
+            # template is skipped; destination errors propagate.
             if src_path.exists():
-                shutil.copy2(src_path, dest_path)
+                shutil.copyfile(src_path, dest_path)
 
     def _generate_conf_py(self):
         """Generate Sphinx configuration with full PyAutoDoc setup."""
@@ -287,342 +662,41 @@ class DocsInitializer:
         if self.project_info["structure"] == "src":
             autoapi_dirs = '["../../src"]'
         else:
-            # Find package directories
-            package_dirs = []
-            for p in self.project_path.iterdir():
-                if p.is_dir() and (p / "__init__.py").exists():
-                    package_dirs.append(f'"../../{p.name}"')
+            package_dirs = [
+                f'"../../{name}"' for name in self.project_info["package_dirs"]
+            ]
             autoapi_dirs = (
                 f'[{", ".join(package_dirs)}]' if package_dirs else '["../.."]'
             )
 
-        conf_content = f'''"""
-Sphinx configuration for {self.project_info["name"]}.
-
-This configuration includes all extensions from PyAutoDoc (43+ extensions).
-Generated by pydevelop-docs init.
-"""
-
-import os
-import sys
-from datetime import date
-
-# -- Path setup --------------------------------------------------------------
-{sys_path}
-
-# -- Project information -----------------------------------------------------
-project = "{self.project_info["name"]}"
-copyright = f"{{date.today().year}}, {self.project_info["name"]} Team"
-author = "{self.project_info["name"]} Team"
-
-# The full version, including alpha/beta/rc tags
-release = "0.1.0"
-
-# -- General configuration ---------------------------------------------------
-
-extensions = [
-    # Core Sphinx Extensions
-    "sphinx.ext.autodoc",
-    "sphinx.ext.autosummary",
-    "sphinx.ext.napoleon",
-    "sphinx.ext.viewcode",
-    "sphinx.ext.intersphinx",
-    "sphinx.ext.todo",
-    "sphinx.ext.coverage",
-    "sphinx.ext.mathjax",
-    "sphinx.ext.ifconfig",
-    "sphinx.ext.githubpages",
-    "sphinx.ext.inheritance_diagram",
-    "sphinx.ext.graphviz",
-    
-    # API Documentation
-    "autoapi.extension",
-    "sphinx_autodoc_typehints",
-    "sphinx.ext.autosectionlabel",
-    
-    # Enhanced Documentation
-    "myst_parser",
-    "sphinx_copybutton",
-    "sphinx_togglebutton",
-    "sphinx_design",
-    "sphinx_tabs.tabs",
-    "sphinx_inline_tabs",
-    
-    # Diagramming
-    "sphinxcontrib.mermaid",
-    "sphinxcontrib.plantuml",
-    "sphinxcontrib.blockdiag",
-    "sphinxcontrib.seqdiag",
-    
-    # Code and Examples
-    "sphinx_codeautolink",
-    "sphinx_exec_code",
-    "sphinx_runpython",
-    
-    # UI Enhancements
-    "sphinx_tippy",
-    "sphinx_favicon",
-    "sphinxemoji.sphinxemoji",
-    
-    # Utilities
-    "sphinx_sitemap",
-    "sphinx_last_updated_by_git",
-    "sphinxext.opengraph",
-    "sphinx_reredirects",
-    
-    # Search and Navigation
-    "sphinx_treeview",
-    
-    # Special Features
-    "enum_tools.autoenum",
-    "sphinx_toolbox",
-    "sphinx_toolbox.more_autodoc.overloads",
-    "sphinx_toolbox.more_autodoc.typehints",
-    "sphinx_toolbox.more_autodoc.sourcelink",
-    
-    # Pydantic Support
-    "sphinxcontrib.autodoc_pydantic",
-]
-
-# -- Extension Configuration -------------------------------------------------
-
-# AutoAPI configuration
-autoapi_dirs = {autoapi_dirs}
-autoapi_type = "python"
-autoapi_template_dir = "_autoapi_templates"
-autoapi_options = [
-    "members",
-    "undoc-members",
-    "show-inheritance",
-    "show-module-summary",
-    "imported-members",
-]
-autoapi_python_class_content = "both"
-autoapi_member_order = "groupwise"
-autoapi_root = "api"
-autoapi_add_toctree_entry = True
-autoapi_keep_files = True
-
-# Napoleon settings
-napoleon_google_docstring = True
-napoleon_numpy_docstring = True
-napoleon_include_init_with_doc = True
-napoleon_include_private_with_doc = False
-napoleon_include_special_with_doc = True
-napoleon_use_admonition_for_examples = True
-napoleon_use_admonition_for_notes = True
-napoleon_use_admonition_for_references = True
-napoleon_use_ivar = True
-napoleon_use_param = True
-napoleon_use_rtype = True
-napoleon_type_aliases = None
-napoleon_attr_annotations = True
-
-# Autodoc settings
-autodoc_default_options = {{
-    "members": True,
-    "member-order": "bysource",
-    "special-members": "__init__",
-    "undoc-members": True,
-    "exclude-members": "__weakref__",
-    "show-inheritance": True,
-}}
-autodoc_typehints = "both"
-autodoc_typehints_format = "short"
-autodoc_mock_imports = []
-autodoc_preserve_defaults = True
-
-# MyST parser
-myst_enable_extensions = [
-    "colon_fence",
-    "deflist",
-    "dollarmath",
-    "fieldlist",
-    "html_admonition",
-    "html_image",
-    "replacements",
-    "smartquotes",
-    "substitution",
-    "tasklist",
-]
-myst_heading_anchors = 3
-myst_substitutions = {{
-    "project": project,
-}}
-
-# Intersphinx mapping
-intersphinx_mapping = {{
-    "python": ("https://docs.python.org/3", None),
-    "numpy": ("https://numpy.org/doc/stable", None),
-    "pandas": ("https://pandas.pydata.org/docs", None),
-    "sphinx": ("https://www.sphinx-doc.org/en/master", None),
-}}
-
-# -- Options for HTML output -------------------------------------------------
-
-html_theme = "furo"
-html_static_path = ["_static"]
-html_css_files = [
-    "css/custom.css",
-]
-html_js_files = [
-    "js/api-enhancements.js",
-]
-
-html_theme_options = {{
-    "light_logo": "logo-light.png",
-    "dark_logo": "logo-dark.png",
-    "sidebar_hide_name": False,
-    "navigation_with_keys": True,
-    "top_of_page_buttons": ["view", "edit"],
-}}
-
-html_favicon = "_static/favicon.ico"
-html_title = f"{{project}} Documentation"
-html_short_title = project
-html_baseurl = ""
-
-# -- Additional Configuration ------------------------------------------------
-
-# Add any paths that contain templates here, relative to this directory.
-templates_path = ["_templates"]
-
-# List of patterns, relative to source directory, that match files and
-# directories to ignore when looking for source files.
-exclude_patterns = []
-
-# The name of the Pygments (syntax highlighting) style to use.
-pygments_style = "sphinx"
-pygments_dark_style = "monokai"
-
-# -- Extension-specific settings ---------------------------------------------
-
-# Sphinx-sitemap
-html_baseurl = "https://docs.example.com/"
-sitemap_locales = [None]
-sitemap_url_scheme = "{{link}}"
-
-# Tippy
-tippy_props = {{
-    "placement": "auto-start",
-    "maxWidth": 500,
-    "theme": "light-border",
-    "interactive": True,
-}}
-
-# Mermaid
-mermaid_version = "10.6.1"
-mermaid_init_js = """
-mermaid.initialize({{
-    startOnLoad: true,
-    theme: 'default',
-    themeVariables: {{
-        primaryColor: '#007bff',
-        primaryBorderColor: '#0056b3',
-        lineColor: '#333',
-        secondaryColor: '#6c757d',
-        tertiaryColor: '#f8f9fa'
-    }}
-}});
-"""
-
-# Todo extension
-todo_include_todos = True
-
-# Coverage extension
-coverage_show_missing_items = True
-
-def setup(app):
-    """Sphinx setup hook."""
-    app.add_css_file("css/custom.css")
-    app.add_js_file("js/api-enhancements.js")
-'''
+        conf_content = _load_template("conf.py.tmpl").substitute(
+            project_name=self.project_info["name"],
+            sys_path=sys_path,
+            autoapi_dirs=autoapi_dirs,
+        )
 
-        conf_path = self.project_path / "docs" / "source" / "conf.py"
-        conf_path.write_text(conf_content)
+        conf_path = self.source_path / "conf.py"
+        conf_path.write_bytes(conf_content.encode("utf-8"))
 
     def _generate_index_rst(self):
         """Generate index.rst file."""
-        index_content = f"""
-Welcome to {self.project_info["name"]} Documentation
-{"=" * (len(self.project_info["name"]) + 25)}
-
-.. toctree::
-   :maxdepth: 2
-   :caption: Contents:
-
-   autoapi/index
-   guides/index
-   examples/index
-   changelog
-
-Indices and tables
-==================
-
-* :ref:`genindex`
-* :ref:`modindex`
-* :ref:`search`
-"""
+        name = self.project_info["name"]
+        index_content = _INDEX_TEMPLATE.format(
+            name=name, underline="=" * (len(name) + 25)
+        )
 
-        index_path = self.project_path / "docs" / "source" / "index.rst"
-        index_path.write_text(index_content)
+        index_path = self.source_path / "index.rst"
+        index_path.write_bytes(index_content.encode("utf-8"))
 
     def _generate_makefile(self):
         """Generate Makefile for building docs."""
-        makefile_content = """# Minimal makefile for Sphinx documentation
-
-# You can set these variables from the command line.
-SPHINXOPTS    = -W --keep-going
-SPHINXBUILD   = sphinx-build
-SOURCEDIR     = source
-BUILDDIR      = build
-
-# Put it first so that "make" without argument is like "make help".
-help:
-\t@$(SPHINXBUILD) -M help "$(SOURCEDIR)" "$(BUILDDIR)" $(SPHINXOPTS) $(O)
-
-.PHONY: help Makefile
-
-# Catch-all target: route all unknown targets to Sphinx using the new
-# "make mode" option.  $(O) is meant as a shortcut for $(SPHINXOPTS).
-%: Makefile
-\t@$(SPHINXBUILD) -M $@ "$(SOURCEDIR)" "$(BUILDDIR)" $(SPHINXOPTS) $(O)
-
-# Custom targets
-clean:
-\trm -rf $(BUILDDIR)/* $(SOURCEDIR)/autoapi
-
-livehtml:
-\tsphinx-autobuild -b html $(SPHINXOPTS) $(SOURCEDIR) $(BUILDDIR)/html
-
-linkcheck:
-\t$(SPHINXBUILD) -b linkcheck $(SOURCEDIR) $(BUILDDIR)/linkcheck
-"""
-
-        makefile_path = self.project_path / "docs" / "Makefile"
-        makefile_path.write_text(makefile_content)
+        makefile_path = self.docs_path / "Makefile"
+        makefile_path.write_bytes(_MAKEFILE)
 
     def _generate_build_scripts(self):
         """Generate build scripts."""
-        build_script = """#!/bin/bash
-# Build documentation
-
-set -e
-
-echo "Building documentation..."
-
-# Clean previous builds
-rm -rf docs/build/*
-
-# Build HTML documentation
-cd docs && make html
-
-echo "Documentation built successfully!"
-echo "Open docs/build/html/index.html to view."
-"""
-
         script_path = self.project_path / "scripts" / "build-docs.sh"
-        script_path.write_text(build_script)
+        script_path.write_bytes(_BUILD_SCRIPT)
         script_path.chmod(0o755)
 
     def _add_poetry_dependencies(self):
@@ -630,62 +704,33 @@ echo "Open docs/build/html/index.html to view."
         pyproject_path = self.project_path / "pyproject.toml"
 
         try:
-            with open(pyproject_path) as f:
-                doc = tomlkit.load(f)
+            content = pyproject_path.read_text()
+
+            # First run: splice the pre-rendered table onto the end of the
+            # file instead of round-tripping the whole document through tomlkit.
+            if self._append_docs_group(pyproject_path, content):
+                click.echo("✅ Added documentation dependencies to pyproject.toml")
+                return
+
+            doc = tomlkit.parse(content)
 
             # Ensure structure exists
-            if "tool" not in doc:
-                doc["tool"] = {}
-            if "poetry" not in doc["tool"]:
-                doc["tool"]["poetry"] = {}
-            if "group" not in doc["tool"]["poetry"]:
-                doc["tool"]["poetry"]["group"] = {}
-            if "docs" not in doc["tool"]["poetry"]["group"]:
-                doc["tool"]["poetry"]["group"]["docs"] = {"dependencies": {}}
-
-            # Add all documentation dependencies
-            deps = doc["tool"]["poetry"]["group"]["docs"]["dependencies"]
-
-            # Core dependencies
-            deps.update(
-                {
-                    "sphinx": "^8.2.3",
-                    "sphinx-autoapi": "^3.6.0",
-                    "sphinx-autodoc-typehints": "^3.1.0",
-                    "sphinxcontrib-autodoc-pydantic": "^2.2.0",
-                    "furo": "^2024.8.6",
-                    "myst-parser": "^4.0.1",
-                    # UI enhancements
-                    "sphinx-copybutton": "^0.5.2",
-                    "sphinx-togglebutton": "^0.3.2",
-                    "sphinx-design": "^0.6.1",
-                    "sphinx-tabs": "^3.4.5",
-                    "sphinx-inline-tabs": "^2023.4.21",
-                    # Diagramming
-                    "sphinxcontrib-mermaid": "^1.0.0",
-                    "sphinxcontrib-plantuml": "^0.30",
-                    "sphinxcontrib-blockdiag": "^3.0.0",
-                    "sphinxcontrib-seqdiag": "^3.0.0",
-                    # Code features
-                    "sphinx-codeautolink": "^0.17.0",
-                    "sphinx-exec-code": "^0.16",
-                    "sphinx-runpython": "^0.4.0",
-                    # Utilities
-                    "sphinx-sitemap": "^2.6.0",
-                    "sphinx-last-updated-by-git": "^0.3.8",
-                    "sphinxext-opengraph": "^0.10.0",
-                    "sphinx-reredirects": "^1.0.0",
-                    "sphinx-favicon": "^1.0.1",
-                    "sphinxemoji": "^0.3.1",
-                    "sphinx-tippy": "^0.4.3",
-                    # Special support
-                    "enum-tools": "^0.13.0",
-                    "sphinx-toolbox": "^3.8.1",
-                    "seed-intersphinx-mapping": "^1.2.2",
-                    # Development
-                    "sphinx-autobuild": "^2024.10.3",
-                }
-            )
+            poetry = doc.setdefault("tool", {}).setdefault("poetry", {})
+            docs = poetry.setdefault("group", {}).setdefault("docs", {})
+            deps = docs.setdefault("dependencies", {})
+
+            # Only touch the document when something is missing or outdated;
+            # re-serializing with tomlkit is the expensive part.
+            missing = {
+                name: version
+                for name, version in _DOCS_DEPS.items()
+                if deps.get(name) != version
+            }
+            if not missing:
+                click.echo("✅ Documentation dependencies already in pyproject.toml")
+                return
+
+            deps.update(missing)
 
             # Write back
             with open(pyproject_path, "w") as f:
@@ -697,6 +742,28 @@ echo "Open docs/build/html/index.html to view."
             click.echo(f"⚠️  Could not add dependencies automatically: {e}")
             click.echo("   Please add the docs group manually to pyproject.toml")
 
+    def _append_docs_group(self, pyproject_path: Path, content: str) -> bool:
+        """Append the docs dependency table as text if pyproject.toml lacks it.
+
+        Returns False when the table already exists or the spliced document
+        does not parse to the expected dependencies, so the caller can fall
+        back to editing through tomlkit.
+        """
+        if _DOCS_GROUP_HEADER in content:
+            return False
+
+        new_content = content.rstrip("\n") + "\n\n" + _DOCS_GROUP_BLOCK
+        try:
+            data = tomllib.loads(new_content)
+            deps = data["tool"]["poetry"]["group"]["docs"]["dependencies"]
+        except (tomllib.TOMLDecodeError, KeyError, TypeError):
+            return False
+        if deps != _DOCS_DEPS:
+            return False
+
+        pyproject_path.write_bytes(new_content.encode("utf-8"))
+        return True
+
 
 @click.group(invoke_without_command=True)
 @click.pass_context
@@ -706,7 +773,10 @@ def cli(ctx):
     Run without arguments for interactive mode.
     """
     if ctx.invoked_subcommand is None:
-        # No subcommand, run interactive mode
+        # No subcommand, run interactive mode. questionary/prompt_toolkit
+        # dominate import time, so only load them when actually needed.
+        from .interactive import interactive_cli as run_interactive
+
         run_interactive()
     pass
 
@@ -746,9 +816,22 @@ def init(
     # Initialize enhanced display
     display = EnhancedDisplay(quiet=quiet, debug=debug)
 
+    # Bail out before the full analysis when the central docs already exist
+    if (project_path / "docs").exists() and not force:
+        display.error("Documentation already exists! Use --force to overwrite.")
+        return
+
+    discovered = set(_list_packages(project_path / "packages"))
+    unknown = [name for name in packages if name not in discovered]
+    if unknown:
+        raise click.BadParameter(
+            f"not a package directory under packages/: {', '.join(unknown)}",
+            param_hint="'--packages'",
+        )
+
     # Analyze project with enhanced detection
     analyzer = ProjectAnalyzer(project_path)
-    analysis = analyzer.analyze()
+    analysis = analyzer.analyze(packages=list(packages) or None)
     analysis["path"] = str(project_path)
 
     # Show detailed analysis
@@ -772,12 +855,9 @@ def init(
                     display.warning("Dependency issues not fixed. Build may fail.")
 
     # Check if documentation exists
-    has_existing_docs = (
-        any(
-            details.get("docs_exists", False)
-            for details in analysis["package_details"].values()
-        )
-        or analysis["central_hub"]["exists"]
+    has_existing_docs = analysis["central_hub"]["exists"] or any(
+        details.get("docs_exists", False)
+        for details in analysis["package_details"].values()
     )
 
     if has_existing_docs and not force:
@@ -798,33 +878,25 @@ def init(
         "conflicts_resolved": len(autofix.get_applied_fixes()),
     }
 
-    # Initialize each package
-    for pkg_name in analysis["packages"]:
-        pkg_path = project_path / "packages" / pkg_name
-        pkg_details = analysis["package_details"][pkg_name]
-
-        display.debug(f"Processing package: {pkg_name}")
-
-        # Ensure docs structure exists
-        if not pkg_details["docs_exists"]:
-            display.debug(f"Creating docs structure for {pkg_name}")
-            (pkg_path / "docs" / "source").mkdir(parents=True, exist_ok=True)
-            summary["packages_created"] += 1
-        else:
-            summary["packages_updated"] += 1
-
-        # Update to use shared config
-        if autofix.ensure_shared_config(pkg_path, pkg_name):
-            display.debug(f"Updated {pkg_name} to use shared config")
-
-        # Create changelog
-        if autofix.create_changelog(pkg_path, pkg_name):
-            display.debug(f"Created changelog for {pkg_name}")
-
-        # Update index.rst
-        if autofix.update_index_rst(pkg_path, pkg_name):
-            display.debug(f"Updated index.rst for {pkg_name}")
-
+    # Initialize each package. Packages are independent and the work is
+    # file I/O, so larger monorepos overlap it across threads; each package's
+    # output and fixes are collected and applied in order from this thread.
+    package_names = analysis["packages"]
+    package_paths = [project_path / "packages" / name for name in package_names]
+    package_details = [analysis["package_details"][name] for name in package_names]
+    configure = functools.partial(_configure_package, project_path)
+    jobs = (package_paths, package_names, package_details)
+    if len(package_names) < _PARALLEL_PACKAGE_THRESHOLD:
+        results = list(map(configure, *jobs))
+    else:
+        with ThreadPoolExecutor(max_workers=min(32, len(package_names))) as executor:
+            results = list(executor.map(configure, *jobs))
+
+    for created, fixes, calls in results:
+        for method, message in calls:
+            getattr(display, method)(message)
+        autofix.fixes_applied.extend(fixes)
+        summary["packages_created" if created else "packages_updated"] += 1
         summary["packages_configured"] += 1
 
     # Initialize documentation
@@ -874,10 +946,11 @@ def doctor(fix, quiet):
         else:
             available_fixes = autofix.analyze_and_fix(analysis, apply_fixes=False)
             if available_fixes:
-                click.echo("\n🔧 Available fixes:")
-                for fix_desc in [f["description"] for f in available_fixes]:
-                    click.echo(f"   - {fix_desc}")
-                click.echo("\nRun with --fix to apply these fixes automatically.")
+                click.echo(
+                    "\n🔧 Available fixes:\n"
+                    + "".join(f"   - {f['description']}\n" for f in available_fixes)
+                    + "\nRun with --fix to apply these fixes automatically."
+                )
 
     # Check package configurations
     for pkg_name, details in analysis["package_details"].items():
@@ -899,8 +972,7 @@ def doctor(fix, quiet):
         applied_fixes = autofix.get_applied_fixes()
         if applied_fixes:
             display.success(f"Applied {len(applied_fixes)} fixes:")
-            for fix in applied_fixes:
-                click.echo(f"   ✅ {fix}")
+            click.echo("\n".join(f"   ✅ {fix}" for fix in applied_fixes))
         else:
             display.warning("No fixes could be applied automatically.")
 
@@ -911,7 +983,14 @@ def doctor(fix, quiet):
 @click.option("--no-parallel", is_flag=True, help="Disable parallel building")
 @click.option("--package", "-p", help="Specific package to build (monorepo only)")
 @click.option("--config", "-f", type=click.Path(exists=True), help="Custom config file")
-def build(clean, builder, no_parallel, package, config):
+@click.option(
+    "--jobs",
+    "-J",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Monorepo packages to build at once (set HAIVE_DOCS_JOBS to share cores)",
+)
+def build(clean, builder, no_parallel, package, config, jobs):
     """Build documentation for current project.
 
     Supports single packages and monorepos. Auto-detects project type.
@@ -940,7 +1019,9 @@ def build(clean, builder, no_parallel, package, config):
             )
         else:
             # Build all packages
-            success = doc_builder.build_all(clean=clean, parallel=not no_parallel)
+            success = doc_builder.build_all(
+                clean=clean, parallel=not no_parallel, jobs=jobs
+            )
     else:
         # Single package
         doc_builder.prepare()
@@ -954,7 +1035,14 @@ def build(clean, builder, no_parallel, package, config):
 
 @cli.command()
 @click.option("--clean", "-c", is_flag=True, help="Clean all build artifacts")
-def build_all(clean):
+@click.option(
+    "--jobs",
+    "-J",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Monorepo packages to build at once (set HAIVE_DOCS_JOBS to share cores)",
+)
+def build_all(clean, jobs):
     """Build documentation for all packages in monorepo."""
     project_path = Path.cwd()
 
@@ -968,7 +1056,7 @@ def build_all(clean):
     builder.prepare()
 
     # Build all packages
-    success = builder.build_all(clean=clean)
+    success = builder.build_all(clean=clean, jobs=jobs)
 
     # Build aggregate docs
     if success:
@@ -992,13 +1080,31 @@ def clean():
         "packages/*/docs/source/autoapi",
     ]
 
+    paths = [
+        path
+        for pattern in patterns
+        for path in project_path.glob(pattern)
+        if path.is_dir()
+    ]
+
+    # Removing each tree is independent unlink-heavy I/O, so overlap them;
+    # results are reported afterwards in match order.
     cleaned = 0
-    for pattern in patterns:
-        for path in project_path.glob(pattern):
-            if path.exists():
-                shutil.rmtree(path)
+    if paths:
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            errors = list(executor.map(_remove_tree, paths))
+        for path, error in zip(paths, errors, strict=True):
+            if error is None:
                 click.echo(f"✅ Cleaned {path}")
                 cleaned += 1
+            else:
+                click.echo(f"⚠️  Could not clean {path}: {error}")
+
+    # Drop the cached project analysis as well
+    cache_path = _analysis_cache_path(project_path)
+    if cache_path is not None and cache_path.exists():
+        cache_path.unlink()
+        click.echo(f"✅ Removed analysis cache {cache_path}")
 
     if cleaned == 0:
         click.echo("✅ No build artifacts found to clean")
@@ -1039,57 +1145,57 @@ def sync(source, target):
     click.echo(f"\n✅ Synced {synced} files from {source} to {target}")
 
 
+@cli.command()
+@click.option("--package-name", "-n", help="Package name (defaults to project name)")
+@click.option(
+    "--package-path",
+    "-p",
+    default="../../src",
+    help="Source path relative to docs/source",
+)
+@click.option("--central-hub", is_flag=True, help="Generate central hub config")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(),
+    default="docs/source/conf.py",
+    help="Where to write conf.py",
+)
+@click.option("--force", "-f", is_flag=True, help="Overwrite existing conf.py")
+def gen_conf(package_name, package_path, central_hub, output, force):
+    """Generate a static conf.py with every setting inlined.
+
+    Sphinx then imports plain assignments instead of evaluating the shared
+    configuration on each build. Re-run after upgrading pydevelop-docs.
+    """
+    from .codegen import write_conf
+
+    project_path = Path.cwd()
+    output_path = project_path / output
+
+    if output_path.exists() and not force:
+        click.echo(f"❌ {output} already exists! Use --force to overwrite.")
+        raise click.Abort()
+
+    if not package_name:
+        package_name = ProjectAnalyzer(project_path).analyze()["name"]
+
+    write_conf(
+        output_path,
+        package_name=package_name,
+        package_path="" if central_hub else package_path,
+        is_central_hub=central_hub,
+    )
+    click.echo(f"✅ Generated static configuration: {output}")
+
+
 @cli.command()
 def list_extensions():
     """List all available Sphinx extensions."""
-    extensions = [
-        "sphinx.ext.autodoc",
-        "sphinx.ext.autosummary",
-        "sphinx.ext.napoleon",
-        "sphinx.ext.viewcode",
-        "sphinx.ext.intersphinx",
-        "sphinx.ext.todo",
-        "sphinx.ext.coverage",
-        "sphinx.ext.mathjax",
-        "sphinx.ext.ifconfig",
-        "sphinx.ext.githubpages",
-        "sphinx.ext.inheritance_diagram",
-        "sphinx.ext.graphviz",
-        "autoapi.extension",
-        "sphinx_autodoc_typehints",
-        "sphinx.ext.autosectionlabel",
-        "myst_parser",
-        "sphinx_copybutton",
-        "sphinx_togglebutton",
-        "sphinx_design",
-        "sphinx_tabs.tabs",
-        "sphinx_inline_tabs",
-        "sphinxcontrib.mermaid",
-        "sphinxcontrib.plantuml",
-        "sphinxcontrib.blockdiag",
-        "sphinxcontrib.seqdiag",
-        "sphinx_codeautolink",
-        "sphinx_exec_code",
-        "sphinx_runpython",
-        "sphinx_tippy",
-        "sphinx_favicon",
-        "sphinxemoji.sphinxemoji",
-        "sphinx_sitemap",
-        "sphinx_last_updated_by_git",
-        "sphinxext.opengraph",
-        "sphinx_reredirects",
-        "sphinx_treeview",
-        "enum_tools.autoenum",
-        "sphinx_toolbox",
-        "sphinx_toolbox.more_autodoc.overloads",
-        "sphinx_toolbox.more_autodoc.typehints",
-        "sphinx_toolbox.more_autodoc.sourcelink",
-        "sphinxcontrib.autodoc_pydantic",
-    ]
-
-    click.echo("📚 Available Sphinx Extensions (43 total):\n")
-    for ext in extensions:
-        click.echo(f"   • {ext}")
+    click.echo(
+        f"📚 Available Sphinx Extensions ({len(_EXTENSIONS)} total):\n\n"
+        + "\n".join(f"   • {ext}" for ext in _EXTENSIONS)
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,34 @@
+"""Static conf.py generation for pydevelop-docs.
+
+Evaluates the shared configuration once and writes every value out as a
+plain assignment, so Sphinx imports a small static module instead of
+running the configuration builder on every build.
+"""
+
+import pprint
+from pathlib import Path
+from typing import Any
+
+from .config import get_haive_config
+
+_HEADER = '''"""Sphinx configuration generated by ``pydevelop-docs gen-conf``.
+
+Regenerate this file instead of editing it by hand.
+"""
+
+'''
+
+
+def render_conf(**kwargs: Any) -> str:
+    """Render ``get_haive_config(**kwargs)`` as conf.py source."""
+    config = get_haive_config(**kwargs)
+    lines = [_HEADER]
+    for name, value in config.items():
+        lines.append(f"{name} = {pprint.pformat(value, sort_dicts=False)}\n")
+    return "".join(lines)
+
+
+def write_conf(path: Path, **kwargs: Any) -> None:
+    """Write a static conf.py for ``get_haive_config(**kwargs)`` to ``path``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(render_conf(**kwargs))
@@ -1,7 +1,9 @@
 """Simplified command implementations for pydevelop-docs."""
 
+import os
 import shutil
 import subprocess
+import tomllib
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -363,8 +365,8 @@ livehtml:
         # Try pyproject.toml
         pyproject = package_path / "pyproject.toml"
         if pyproject.exists():
-            with open(pyproject) as f:
-                data = tomlkit.load(f)
+            with open(pyproject, "rb") as f:
+                data = tomllib.load(f)
             if "tool" in data and "poetry" in data["tool"]:
                 return data["tool"]["poetry"].get("name", package_path.name)
             elif "project" in data:
@@ -481,7 +483,7 @@ class BuildCommand(DocsCommand):
         cmd = ["sphinx-build", "-b", "html", "-W", "--keep-going"]
 
         if parallel:
-            cmd.extend(["-j", "auto"])
+            cmd.extend(["-j", os.environ.get("HAIVE_DOCS_JOBS", "auto")])
 
         cmd.extend(["source", "build/html"])
 
@@ -30,16 +30,40 @@ Example:
     >>> globals().update(config)
 """
 
+import functools
 import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# Body of the sphinx-notfound-page 404 page
+_NOTFOUND_BODY = """
+<h1>🚀 Oops! Page Not Found</h1>
+<p>The page you're looking for seems to have wandered off into the documentation cosmos.</p>
+
+<div class="admonition tip">
+<p class="admonition-title">Try these options:</p>
+<ul>
+<li><strong>Search:</strong> Use the search box above to find what you need</li>
+<li><strong>API Reference:</strong> Check our <a href="/autoapi/">complete API documentation</a></li> 
+<li><strong>Home:</strong> Return to the <a href="/">main documentation</a></li>
+</ul>
+</div>
+
+<p>Still can't find what you're looking for? <a href="https://github.com/haive-ai/haive/issues">Report an issue</a> and we'll help you out!</p>
+            """
+
+# GitHub mark shown in the Furo footer
+_GITHUB_ICON_SVG = """<svg stroke="currentColor" fill="currentColor" stroke-width="0" viewBox="0 0 16 16">
+                    <path fill-rule="evenodd" d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"></path>
+                </svg>"""
+
 
 def get_haive_config(
     package_name: str,
     package_path: str,
     is_central_hub: bool = False,
     extra_extensions: Optional[List[str]] = None,
+    profile: str = "complete",
 ) -> Dict[str, Any]:
     """Get complete PyDevelop Sphinx configuration for a package.
 
@@ -56,6 +80,9 @@ def get_haive_config(
             Enables sphinx-collections for aggregating multiple package docs.
         extra_extensions: Additional Sphinx extensions to include beyond the 40+
             that are already configured.
+        profile: Which extension tier to load. "minimal" keeps the core API
+            documentation stack, "standard" adds theming, diagrams and
+            navigation helpers, and "complete" (the default) loads all 40+.
 
     Returns:
         Dictionary containing complete Sphinx configuration settings including:
@@ -83,9 +110,9 @@ def get_haive_config(
     """
 
     # Base project info
-    display_name = package_name.replace("haive-", "").replace("-", " ").title()
-    if package_name == "haive-docs":
-        display_name = "Haive AI Agent Framework"
+    display_name = _display_name(package_name)
+
+    debuginfo = os.environ.get("HAIVE_DEBUGINFO") == "1"
 
     config = {
         # Project information
@@ -96,7 +123,9 @@ def get_haive_config(
         "copyright": "2025, Haive Team",
         "release": "0.1.0",
         # Extensions - Complete 40+ extension system with optimal configurations
-        "extensions": _get_complete_extensions(is_central_hub, extra_extensions),
+        "extensions": _get_complete_extensions(
+            is_central_hub, extra_extensions, profile
+        ),
         # General configuration
         "templates_path": ["_templates", "_autoapi_templates"],
         "html_static_path": ["_static"],
@@ -110,6 +139,7 @@ def get_haive_config(
             "**/symlink_loops",  # Prevent symlink loop directories
         ],
         "add_module_names": False,
+        "toc_object_entries": False,  # Per-object TOC entries slow big builds
         "toc_object_entries_show_parents": "hide",
         # TOC Configuration - Enhanced nesting and presentation
         "html_sidebars": {
@@ -132,8 +162,6 @@ def get_haive_config(
         "toctree_includehidden": True,  # Include hidden TOC entries
         # Jinja2 options
         "jinja_env_options": {"extensions": ["jinja2.ext.do"]},
-        # AutoAPI configuration (if not central hub)
-        **(_get_complete_autoapi_config(package_path) if not is_central_hub else {}),
         # Napoleon configuration
         "napoleon_google_docstring": True,
         "napoleon_numpy_docstring": True,
@@ -289,21 +317,7 @@ def get_haive_config(
         # Sphinx-notfound-page configuration
         "notfound_context": {
             "title": "Page Not Found",
-            "body": f"""
-<h1>🚀 Oops! Page Not Found</h1>
-<p>The page you're looking for seems to have wandered off into the documentation cosmos.</p>
-
-<div class="admonition tip">
-<p class="admonition-title">Try these options:</p>
-<ul>
-<li><strong>Search:</strong> Use the search box above to find what you need</li>
-<li><strong>API Reference:</strong> Check our <a href="/autoapi/">complete API documentation</a></li> 
-<li><strong>Home:</strong> Return to the <a href="/">main documentation</a></li>
-</ul>
-</div>
-
-<p>Still can't find what you're looking for? <a href="https://github.com/haive-ai/haive/issues">Report an issue</a> and we'll help you out!</p>
-            """,
+            "body": _NOTFOUND_BODY,
         },
         "notfound_template": "page.html",
         "notfound_no_urls_prefix": True,
@@ -323,9 +337,10 @@ def get_haive_config(
         # Sphinx-changelog configuration
         "changelog_sections_past": 10,  # How many past releases to show
         "changelog_inner_tag_sort": ["breaking", "feature", "bugfix", "improvement"],
-        # Debug info configuration
-        "debuginfo_enable": True,
-        "debuginfo_show_performance": True,
+        # Debug info configuration - instrumentation is opt-in so the config
+        # stays identical between runs and incremental builds stay incremental
+        "debuginfo_enable": debuginfo,
+        "debuginfo_show_performance": debuginfo,
         "debuginfo_show_warnings": True,
         "debuginfo_show_extensions": True,
         # OpenGraph configuration
@@ -388,8 +403,6 @@ def get_haive_config(
                 "type": "image/x-icon",
             },
         ],
-        # Collections configuration (only for central hub)
-        **(_get_collections_config() if is_central_hub else {}),
         # Theme configuration - INTENSE FURO THEMING
         "html_theme": "furo",
         "html_theme_options": _get_complete_theme_options(package_name, is_central_hub),
@@ -409,6 +422,13 @@ def get_haive_config(
         ],
     }
 
+    if is_central_hub:
+        # Collections configuration (only for central hub)
+        config.update(_get_collections_config())
+    else:
+        # AutoAPI configuration (individual packages)
+        config.update(_get_complete_autoapi_config(package_path))
+
     return config
 
 
@@ -426,8 +446,67 @@ def get_central_hub_config() -> Dict[str, Any]:
     )
 
 
+# Ordered (extension, tier) pairs; a profile loads every tier up to its own
+_EXTENSIONS = [
+    # Core (Priority 1-10) - AutoAPI FIRST as requested
+    ("sphinx.ext.autodoc", "minimal"),
+    ("sphinx.ext.napoleon", "minimal"),
+    ("sphinx.ext.viewcode", "minimal"),
+    ("sphinx.ext.intersphinx", "minimal"),
+    # "seed_intersphinx_mapping",  # Disabled - requires requirements.txt
+    # Enhanced API (Priority 11-20)
+    ("sphinxcontrib.autodoc_pydantic", "minimal"),
+    ("sphinx_autodoc_typehints", "minimal"),
+    # Content & Design (Priority 21-30) - INTENSE FURO FOCUS
+    ("myst_parser", "minimal"),
+    ("sphinx_design", "standard"),  # KEY for intense theming
+    ("sphinx_togglebutton", "standard"),
+    ("sphinx_copybutton", "standard"),
+    ("sphinx_tabs.tabs", "standard"),
+    # Execution (Priority 31-40) - TESTING FOCUS
+    ("sphinxcontrib.programoutput", "standard"),
+    # Diagrams (Priority 41-50) - MERMAID FOCUS
+    ("sphinx.ext.graphviz", "standard"),
+    ("sphinxcontrib.mermaid", "standard"),
+    ("sphinxcontrib.plantuml", "complete"),
+    # Utilities (Priority 51-60)
+    ("sphinx_sitemap", "standard"),
+    ("sphinx_codeautolink", "standard"),
+    ("sphinx_remove_toctrees", "standard"),
+    # TOC Enhancements (Priority 61-70)
+    ("sphinx_treeview", "standard"),
+    # Enhanced Features (Priority 71-80)
+    ("sphinx_toggleprompt", "standard"),
+    ("sphinx_prompt", "standard"),
+    ("sphinx_last_updated_by_git", "standard"),
+    ("sphinx_inlinecode", "standard"),
+    ("sphinx_icontract", "complete"),
+    ("sphinx_tippy", "complete"),
+    # Documentation Tools (Priority 81-90)
+    ("sphinx_comments", "complete"),
+    ("sphinx_contributors", "complete"),
+    ("sphinx_issues", "standard"),
+    ("sphinx_needs", "complete"),
+    ("sphinxarg.ext", "complete"),
+    ("notfound.extension", "standard"),
+    ("sphinx_reredirects", "standard"),
+    ("sphinxext.rediraffe", "complete"),
+    ("sphinx_git", "complete"),
+    ("sphinx_changelog", "complete"),
+    ("sphinx_debuginfo", "complete"),
+    ("sphinxext.opengraph", "standard"),
+    ("sphinx_tags", "complete"),
+    ("sphinx_favicon", "standard"),
+    ("sphinx_combine", "complete"),
+]
+
+_PROFILES = ("minimal", "standard", "complete")
+
+
 def _get_complete_extensions(
-    is_central_hub: bool, extra_extensions: Optional[List[str]] = None
+    is_central_hub: bool,
+    extra_extensions: Optional[List[str]] = None,
+    profile: str = "complete",
 ) -> List[str]:
     """Get the complete 40+ Sphinx extension system.
 
@@ -437,61 +516,20 @@ def _get_complete_extensions(
     Args:
         is_central_hub: If True, includes sphinx-collections for monorepo docs
         extra_extensions: Additional extensions to append to the list
+        profile: Extension tier to load: "minimal", "standard" or "complete"
 
     Returns:
         List of extension names, optimized for compatibility and functionality
     """
-    extensions = [
-        # Core (Priority 1-10) - AutoAPI FIRST as requested
-        "sphinx.ext.autodoc",
-        "sphinx.ext.napoleon",
-        "sphinx.ext.viewcode",
-        "sphinx.ext.intersphinx",
-        # "seed_intersphinx_mapping",  # Disabled - requires requirements.txt
-        # Enhanced API (Priority 11-20)
-        "sphinxcontrib.autodoc_pydantic",
-        "sphinx_autodoc_typehints",
-        # Content & Design (Priority 21-30) - INTENSE FURO FOCUS
-        "myst_parser",
-        "sphinx_design",  # KEY for intense theming
-        "sphinx_togglebutton",
-        "sphinx_copybutton",
-        "sphinx_tabs.tabs",
-        # Execution (Priority 31-40) - TESTING FOCUS
-        "sphinxcontrib.programoutput",
-        # Diagrams (Priority 41-50) - MERMAID FOCUS
-        "sphinx.ext.graphviz",
-        "sphinxcontrib.mermaid",
-        "sphinxcontrib.plantuml",
-        # Utilities (Priority 51-60)
-        "sphinx_sitemap",
-        "sphinx_codeautolink",
-        # TOC Enhancements (Priority 61-70)
-        "sphinx_treeview",
-        # Enhanced Features (Priority 71-80)
-        "sphinx_toggleprompt",
-        "sphinx_prompt",
-        "sphinx_last_updated_by_git",
-        "sphinx_inlinecode",
-        "sphinx_icontract",
-        "sphinx_tippy",
-        # Documentation Tools (Priority 81-90)
-        "sphinx_comments",
-        "sphinx_contributors",
-        "sphinx_issues",
-        "sphinx_needs",
-        "sphinxarg.ext",
-        "notfound.extension",
-        "sphinx_reredirects",
-        "sphinxext.rediraffe",
-        "sphinx_git",
-        "sphinx_changelog",
-        "sphinx_debuginfo",
-        "sphinxext.opengraph",
-        "sphinx_tags",
-        "sphinx_favicon",
-        "sphinx_combine",
-    ]
+    try:
+        level = _PROFILES.index(profile)
+    except ValueError:
+        raise ValueError(
+            f"Unknown extension profile {profile!r}; expected one of {_PROFILES}"
+        ) from None
+
+    tiers = _PROFILES[: level + 1]
+    extensions = [name for name, tier in _EXTENSIONS if tier in tiers]
 
     # Add AutoAPI for individual packages
     if not is_central_hub:
@@ -505,7 +543,16 @@ def _get_complete_extensions(
     if extra_extensions:
         extensions.extend(extra_extensions)
 
-    return extensions
+    # Ordered de-duplication, in case extras repeat a built-in extension
+    return list(dict.fromkeys(extensions))
+
+
+@functools.lru_cache(maxsize=64)
+def _display_name(package_name: str) -> str:
+    """Derive the human-readable title used across the config."""
+    if package_name == "haive-docs":
+        return "Haive AI Agent Framework"
+    return package_name.replace("haive-", "").replace("-", " ").title()
 
 
 def _get_complete_autoapi_config(package_path: str) -> Dict[str, Any]:
@@ -532,6 +579,8 @@ def _get_complete_autoapi_config(package_path: str) -> Dict[str, Any]:
         "autoapi_member_order": "groupwise",
         "autoapi_root": "autoapi",
         "autoapi_toctree_depth": 3,
+        # Keep generated API pages out of the sidebar toctree
+        "remove_from_toctrees": ["autoapi/*/*.rst", "autoapi/*/*/*.rst"],
     }
 
 
@@ -615,9 +664,7 @@ def _get_complete_theme_options(
             {
                 "name": "GitHub",
                 "url": "https://github.com/haive-ai/haive/",
-                "html": """<svg stroke="currentColor" fill="currentColor" stroke-width="0" viewBox="0 0 16 16">
-                    <path fill-rule="evenodd" d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"></path>
-                </svg>""",
+                "html": _GITHUB_ICON_SVG,
             },
         ],
     }
@@ -625,7 +672,7 @@ def _get_complete_theme_options(
 
 def _get_complete_intersphinx_mapping() -> Dict[str, tuple]:
     """Get complete intersphinx mapping for cross-references."""
-    return {
+    mapping = {
         "python": ("https://docs.python.org/3", None),
         "sphinx": ("https://www.sphinx-doc.org/en/master", None),
         "pydantic": ("https://docs.pydantic.dev/latest", None),
@@ -635,3 +682,65 @@ def _get_complete_intersphinx_mapping() -> Dict[str, tuple]:
         # "haive-core": ("https://docs.haive.ai/packages/haive-core/", None),
         # "haive-agents": ("https://docs.haive.ai/packages/haive-agents/", None),
     }
+
+    # Opt-in: fetch all inventories up front instead of on every cold build
+    if os.environ.get("HAIVE_PREFETCH_INTERSPHINX") == "1":
+        return _prefetch_inventories(mapping)
+    return mapping
+
+
+def _prefetch_inventories(mapping: Dict[str, tuple]) -> Dict[str, tuple]:
+    """Download intersphinx inventories in parallel into a local cache.
+
+    Each inventory is revalidated with ``If-Modified-Since``. The returned
+    mapping tries the cached file first and falls back to the remote
+    inventory, so a failed download never breaks the build.
+    """
+    # Imported here: urllib.request alone pulls in http.client and email,
+    # which every conf.py would otherwise pay for on import
+    import hashlib
+    import tempfile
+    import urllib.request
+    from concurrent.futures import ThreadPoolExecutor
+    from email.utils import formatdate
+
+    # Resolved here rather than at import: Path.home() raises RuntimeError
+    # when HOME cannot be determined, which must not break conf.py.
+    try:
+        cache_dir = Path.home() / ".cache" / "haive-docs" / "intersphinx"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except (OSError, RuntimeError):
+        return mapping
+
+    def fetch(url: str) -> Optional[Path]:
+        target = cache_dir / (hashlib.sha256(url.encode()).hexdigest() + ".inv")
+        request = urllib.request.Request(url.rstrip("/") + "/objects.inv")
+        if target.exists():
+            request.add_header(
+                "If-Modified-Since", formatdate(target.stat().st_mtime, usegmt=True)
+            )
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                data = response.read()
+            # Write beside the target and rename, so concurrent builds never
+            # read a partially written inventory.
+            fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_name, target)
+            except OSError:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            # Includes 304 Not Modified and network failures
+            pass
+        return target if target.exists() else None
+
+    with ThreadPoolExecutor(max_workers=len(mapping)) as executor:
+        cached = executor.map(fetch, [url for url, _ in mapping.values()])
+
+    return {
+        name: (url, (str(path), None)) if path else (url, inventory)
+        for (name, (url, inventory)), path in zip(mapping.items(), cached, strict=True)
+    }
@@ -4,23 +4,35 @@ from typing import Any, Dict, List
 
 import click
 
+# Header printed by show_analysis, formatted in one pass
+_ANALYSIS_HEADER = (
+    "🔍 Analyzing project at %(path)s...\n"
+    "📦 Project: %(name)s (%(type)s)\n"
+    "🔧 Package Manager: %(package_manager)s\n"
+)
+
 
 class EnhancedDisplay:
     """Enhanced display manager for CLI output."""
 
     def __init__(self, quiet: bool = False, debug: bool = False):
         self.quiet = quiet
-        self.debug = debug
+        self.debug_enabled = debug
 
     def show_analysis(self, analysis: Dict[str, Any]) -> None:
         """Display detailed project analysis."""
         if self.quiet:
             return
 
-        click.echo(f"🔍 Analyzing project at {analysis.get('path', 'unknown')}...")
-        click.echo(f"📦 Project: {analysis['name']} ({analysis['type']})")
-        click.echo(f"🔧 Package Manager: {analysis['package_manager']}")
-        click.echo()
+        click.echo(
+            _ANALYSIS_HEADER
+            % {
+                "path": analysis.get("path", "unknown"),
+                "name": analysis["name"],
+                "type": analysis["type"],
+                "package_manager": analysis["package_manager"],
+            }
+        )
 
         # Show package detection
         if analysis["type"] == "monorepo":
@@ -184,7 +196,7 @@ class EnhancedDisplay:
 
     def debug(self, message: str) -> None:
         """Show debug message if debug mode is enabled."""
-        if self.debug:
+        if self.debug_enabled:
             click.echo(f"🐛 DEBUG: {message}", err=True)
 
     def error(self, message: str) -> None:
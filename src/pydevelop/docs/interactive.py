@@ -5,7 +5,6 @@ from typing import Any, Dict, List, Optional
 
 import click
 import questionary
-import tomlkit
 import yaml
 from rich import print as rprint
 from rich.console import Console
@@ -357,7 +356,7 @@ class InteractiveCLI:
                     analysis["package_dirs"].append(item.name)
 
         # Count Python files
-        analysis["python_files"] = len(list(self.project_path.rglob("*.py")))
+        analysis["python_files"] = sum(1 for _ in self.project_path.rglob("*.py"))
 
         # Determine type
         if analysis["has_packages"]:
@@ -1,10 +1,10 @@
 """Package-specific handlers for different Python project types."""
 
 import json
+import tomllib
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import tomlkit
 import yaml
 
 
@@ -40,8 +40,8 @@ class PackageHandler:
 
     def _parse_pyproject(self) -> Dict[str, Any]:
         """Parse pyproject.toml for package info."""
-        with open(self.project_path / "pyproject.toml") as f:
-            data = tomlkit.load(f)
+        with open(self.project_path / "pyproject.toml", "rb") as f:
+            data = tomllib.load(f)
 
         info = {"type": "pyproject"}
 